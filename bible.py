@@ -1,38 +1,164 @@
 import sys
+import asyncio
+import html
 import json
+import mmap
+import pickle
+import re
+import sqlite3
 import urllib.request
 import random # Added for random welcome messages
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QComboBox, QPushButton, QTextEdit, QLineEdit, QLabel,
     QGroupBox, QStatusBar, QMessageBox, QSplitter, QFrame
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont, QTextCharFormat, QColor, QPalette, QIcon, QShortcut, QKeySequence
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QObject, QRunnable, QThreadPool, QFile
+from PySide6.QtGui import QFont, QTextCharFormat, QTextBlock, QTextCursor, QColor, QPalette, QIcon, QShortcut, QKeySequence
+from PySide6 import QtAsyncio
+
+import resources_rc  # Registers the :/styles.qss resource
+
+# Streaming JSON parser, preferring the C backend
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson.backends.python as ijson
+    except ImportError:
+        ijson = None
+
+if ijson is not None:
+    from ijson.common import JSONError
+    JSON_ERRORS = (json.JSONDecodeError, JSONError)
+else:
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+# Fast JSON parser and serializer, used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 BIBLE_FILEPATH = 'kjv.json'
+# Generated files live next to this script, not in the working directory, so the
+# pickle is only ever loaded from where the code itself came from
+APP_DIR = Path(__file__).resolve().parent
+CACHE_FILEPATH = APP_DIR / 'kjv.cache.pkl'
+SEARCH_DB_FILEPATH = APP_DIR / 'kjv.search.sqlite'
+# Bumped whenever the layout of the cached index changes
+CACHE_VERSION = 6
+
+# Welcome page; only the encouraging message changes between displays
+WELCOME_HTML_TEMPLATE = """<div style="font-family: 'Segoe UI', sans-serif; padding: 15px; background-color: #e0f2fe; border-radius: 8px; border: 1px solid #90cdf4; margin-bottom: 25px;">
+    <p style="font-size: 16px; color: #1e40af; font-weight: bold; margin: 0;">
+        {msg}
+    </p>
+</div>
+<div style="font-family: Georgia; font-size: 14px; line-height: 2.0; color: #1f2937; margin-top: 20px;">
+    <h3 style="color: #1e40af; border-bottom: 1px solid #d1d5db; padding-bottom: 5px;">📖 Getting Started</h3>
+    <ul style="list-style-type: none; padding-left: 0;">
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Select a Book and Chapter from the dropdowns above.</li>
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Click 'Read Chapter' or the chapter will load automatically.</li>
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Use <b>◄ Previous</b> and <b>Next ►</b> buttons to navigate between chapters.</li>
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Use the <b>Search</b> box to find verses containing specific words.</li>
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Press <b>Ctrl+F</b> to quickly jump to search.</li>
+    </ul>
 
-class DataLoader(QThread):
-    """Background thread for loading Bible data."""
-    data_loaded = Signal(dict)
+    <h3 style="color: #1e40af; border-bottom: 1px solid #d1d5db; padding-bottom: 5px;">⌨️ Keyboard Shortcuts</h3>
+    <ul style="list-style-type: none; padding-left: 0;">
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> <b>Left Arrow:</b> Previous Chapter</li>
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> <b>Right Arrow:</b> Next Chapter</li>
+        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> <b>Enter (in search):</b> Search Bible</li>
+    </ul>
+</div>
+<div style="font-family: Georgia; font-size: 14px; line-height: 1.5; color: #6b7280; margin-top: 25px; padding-top: 10px; border-top: 1px dashed #d1d5db;">
+    The King James Version of the Bible is loaded and ready to read.
+</div>
+"""
+
+# Chapter markup: a heading paragraph, then one paragraph, and so one block, per verse
+HEADING_HTML_TEMPLATE = '<p style="margin-top: 0px; margin-bottom: 20px; color: #1e40af; font-size: 18pt; font-weight: bold;">{title}</p>'
+VERSE_STYLE = "margin-top: 8px; margin-bottom: 8px; line-height: 150%;"
+CURRENT_VERSE_STYLE = VERSE_STYLE + " margin-left: 10px; background-color: #dbeafe;"
+VERSE_HTML_TEMPLATE = ('<p style="{style}"><span style="color: #3b82f6; font-size: 9pt; font-weight: bold;">{number} </span>'
+                       '<span style="color: #1f2937; font-size: 13pt;">{text}</span></p>')
+HIGHLIGHT_HTML_TEMPLATE = '<span style="background-color: #fef3c7; font-weight: 600;">{text}</span>'
+# A search result: its reference, then the verse text indented beneath it
+RESULT_HTML_TEMPLATE = ('<p style="margin-top: 15px; margin-bottom: 0px; color: #059669; font-size: 11pt; font-weight: bold;">{number}. {reference}</p>'
+                        '<p style="margin-top: 4px; margin-bottom: 8px; margin-left: 12px; line-height: 150%;">'
+                        '<span style="color: #1f2937; font-size: 13pt;">{text}</span></p>')
+
+
+@dataclass(slots=True)
+class Hit:
+    """A verse matching a search."""
+    book: str
+    chapter: str
+    verse: str
+    text: str
+
+    @property
+    def reference(self) -> str:
+        """The verse reference, e.g. John 3:16."""
+        return f"{self.book} {self.chapter}:{self.verse}"
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    """Serializes to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def bible_file_stamp() -> Tuple[int, int]:
+    """The size and modification time of the JSON file, identifying the copy a cache was built from."""
+    stat = Path(BIBLE_FILEPATH).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class DataLoader(QObject):
+    """Asynchronous task for loading Bible data."""
+    # object, not dict, so the data is passed along rather than copied through a QVariantMap
+    data_loaded = Signal(object)
+    book_parsed = Signal(str, object)
     status_update = Signal(str)
 
     def __init__(self):
         super().__init__()
+        self.cache: Dict[str, Any] = {}
+
+    async def load(self):
+        """Load Bible data without blocking the event loop."""
+        await asyncio.to_thread(self.run)
 
     def run(self):
-        """Load Bible data in background."""
+        """Load Bible data and report it."""
+        # Emitting from the worker thread keeps data_loaded queued after every book_parsed
         data = self.load_data()
         self.data_loaded.emit(data)
 
     def load_data(self) -> Dict[str, Any]:
-        """Loads the Bible data from the JSON file or downloads it."""
+        """Loads the Bible data from the cache, the JSON file or downloads it."""
+        self.cache = self.load_cache()
+        if self.cache:
+            self.status_update.emit("Bible data loaded successfully")
+            return self.cache['data']
+
         try:
-            with open(BIBLE_FILEPATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = self.map_data()
+            elif ijson is not None:
+                data = self.stream_data()
+            else:
+                with open(BIBLE_FILEPATH, 'rb') as f:
+                    data = json.load(f)
 
             if self.validate_data(data):
                 self.status_update.emit("Bible data loaded successfully")
@@ -42,10 +168,59 @@ class DataLoader(QThread):
 
         except FileNotFoundError:
             return self.download_bible_data()
-        except json.JSONDecodeError:
+        except JSON_ERRORS:
             self.status_update.emit("Error: Corrupted JSON file")
             return {}
 
+    def load_cache(self) -> Dict[str, Any]:
+        """Loads the pickled data and search index, unless they were built from another JSON file."""
+        try:
+            source = bible_file_stamp() if Path(BIBLE_FILEPATH).exists() else None
+            with open(CACHE_FILEPATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cache = pickle.loads(mm)
+        except Exception:
+            return {}
+
+        if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+            return {}
+        # An edited kjv.json, or another one in a different working directory
+        if source is not None and cache.get('source') != source:
+            return {}
+        # Search hits are ids into the cached index, so the database must have been built from it
+        if self.search_database_size() != len(cache['index']['verses_flat']):
+            return {}
+        return cache
+
+    def search_database_size(self) -> int:
+        """Returns the number of verses the search database was built from, or -1 without one."""
+        try:
+            connection = sqlite3.connect(f"{SEARCH_DB_FILEPATH.as_uri()}?mode=ro", uri=True)
+            try:
+                return connection.execute("PRAGMA user_version").fetchone()[0]
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return -1
+
+    def map_data(self) -> Dict[str, Any]:
+        """Parses the memory-mapped JSON file in a single orjson call."""
+        if Path(BIBLE_FILEPATH).stat().st_size == 0:
+            # mmap cannot map an empty file; let orjson report it as invalid JSON
+            return orjson.loads(b"")
+
+        with open(BIBLE_FILEPATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+    def stream_data(self) -> Dict[str, Any]:
+        """Parses the JSON file book by book, announcing each book as it is parsed."""
+        data = {}
+        with open(BIBLE_FILEPATH, 'rb') as f:
+            for book_name, chapters in ijson.kvitems(f, '', use_float=True):
+                data[book_name] = chapters
+                self.book_parsed.emit(book_name, chapters)
+        return data
+
     def validate_data(self, data: Dict) -> bool:
         """Validates the Bible data structure."""
         if not isinstance(data, dict) or len(data) == 0:
@@ -67,18 +242,22 @@ class DataLoader(QThread):
             req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
 
             with urllib.request.urlopen(req, timeout=30) as response:
-                raw_data = json.load(response)
-
-            self.status_update.emit("Converting data format...")
-            converted = {}
-            for book_obj in raw_data:
-                book_name = book_obj["book"]
-                chapters = book_obj["chapters"]
-                converted[book_name] = chapters
-
-            self.status_update.emit("Saving data locally...")
-            with open(BIBLE_FILEPATH, "w", encoding="utf-8") as f:
-                json.dump(converted, f, ensure_ascii=False, indent=2)
+                if ijson is not None:
+                    converted = self.stream_download(response)
+                else:
+                    raw_data = json.load(response)
+
+            if ijson is None:
+                self.status_update.emit("Converting data format...")
+                converted = {}
+                for book_obj in raw_data:
+                    book_name = book_obj["book"]
+                    chapters = book_obj["chapters"]
+                    converted[book_name] = chapters
+
+                self.status_update.emit("Saving data locally...")
+                with open(BIBLE_FILEPATH, "wb") as f:
+                    f.write(dump_json_bytes(converted))
 
             self.status_update.emit("Bible data loaded successfully")
             return converted
@@ -86,6 +265,191 @@ class DataLoader(QThread):
             self.status_update.emit(f"Download failed: {str(e)}")
             return {}
 
+    def stream_download(self, response) -> Dict[str, Any]:
+        """Converts and saves each downloaded book as soon as it has been parsed."""
+        converted = {}
+        partial_path = Path(BIBLE_FILEPATH + ".part")
+
+        with open(partial_path, "wb") as f:
+            f.write(b"{")
+            for book_obj in ijson.items(response, 'item'):
+                book_name = book_obj["book"]
+                chapters = book_obj["chapters"]
+
+                if converted:
+                    f.write(b",")
+                f.write(dump_json_bytes(book_name) + b":" + dump_json_bytes(chapters))
+
+                converted[book_name] = chapters
+                self.book_parsed.emit(book_name, chapters)
+            f.write(b"}")
+
+        partial_path.replace(BIBLE_FILEPATH)
+        return converted
+
+
+class IndexBuilder(QThread):
+    """Background thread for building the search index."""
+    index_built = Signal(object)
+
+    def __init__(self, bible_data: Dict[str, Any], book_names: Tuple[str, ...],
+                 sorted_chapters: Dict[str, List[str]],
+                 chapters: Dict[Tuple[str, str], Tuple[List[str], List[str]]]):
+        super().__init__()
+        self.bible_data = bible_data
+        self.book_names = book_names
+        self.sorted_chapters = sorted_chapters
+        self.chapters = chapters
+
+    def run(self):
+        """Build the search index in background."""
+        index = self.build_index()
+        self.build_search_database(index['verses_flat'])
+        self.index_built.emit(index)
+        self.save_cache(index)
+
+    def build_search_database(self, verses_flat: List[str]):
+        """Writes every verse, keyed by its id, into an SQLite full-text table indexed by trigrams."""
+        database_path = SEARCH_DB_FILEPATH
+        temp_path = database_path.with_suffix('.tmp')
+        try:
+            # Never leave a database from an older build behind to be paired with this index
+            database_path.unlink(missing_ok=True)
+            temp_path.unlink(missing_ok=True)
+            connection = sqlite3.connect(temp_path)
+            try:
+                try:
+                    connection.execute("CREATE VIRTUAL TABLE verses USING fts5(text, tokenize='trigram')")
+                except sqlite3.OperationalError:
+                    # SQLite without FTS5 trigrams; LIKE queries then scan the table
+                    connection.execute("CREATE TABLE verses(text TEXT)")
+                # Stored casefolded, so LIKE with a casefolded term matches exactly as casefolding does
+                connection.executemany("INSERT INTO verses(rowid, text) VALUES (?, ?)",
+                                       ((verse_id, text.casefold()) for verse_id, text in enumerate(verses_flat)))
+                # Checked by DataLoader.load_cache against the cached index
+                connection.execute(f"PRAGMA user_version = {len(verses_flat)}")
+                connection.commit()
+            finally:
+                connection.close()
+            temp_path.replace(database_path)
+        except (OSError, sqlite3.Error):
+            # Searches fall back to checking every verse
+            pass
+
+    def save_cache(self, index: Dict[str, Any]):
+        """Pickles the data, orderings and index so the next start can skip parsing."""
+        cache = {
+            'data': self.bible_data,
+            'sorted_chapters': self.sorted_chapters,
+            'chapters': self.chapters,
+            'index': index,
+            'version': CACHE_VERSION,
+        }
+
+        cache_path = CACHE_FILEPATH
+        temp_path = cache_path.with_suffix('.tmp')
+        try:
+            cache['source'] = bible_file_stamp()
+            with open(temp_path, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(cache_path)
+        except OSError:
+            # The cache is only an optimisation
+            pass
+
+    def build_index(self) -> Dict[str, Any]:
+        """Flattens all verses in canonical order along with their references."""
+        verses_flat: List[str] = []
+        # Verse references as parallel arrays instead of one tuple per verse
+        verse_book_ids = array('H')
+        verse_chapter_nums = array('H')
+        verse_nums = array('H')
+
+        for book_id, book_name in enumerate(self.book_names):
+            for chapter_num in self.sorted_chapters[book_name]:
+                verse_numbers, verse_texts = self.chapters[(book_name, chapter_num)]
+                for verse_num, text in zip(verse_numbers, verse_texts):
+                    verses_flat.append(text)
+                    verse_book_ids.append(book_id)
+                    verse_chapter_nums.append(int(chapter_num))
+                    verse_nums.append(int(verse_num))
+
+        return {
+            'verses_flat': verses_flat,
+            'verse_book_ids': verse_book_ids,
+            'verse_chapter_nums': verse_chapter_nums,
+            'verse_nums': verse_nums,
+        }
+
+
+class SearchWorker(QRunnable):
+    """Background task for searching the Bible."""
+
+    class Signals(QObject):
+        finished = Signal(int, object)
+
+    def __init__(self, app: 'BibleReaderApp', normalized_term: str, token: int):
+        super().__init__()
+        self.app = app
+        self.normalized_term = normalized_term
+        self.token = token
+        self.signals = SearchWorker.Signals()
+
+        self.verses_flat = app.verses_flat
+        self.book_names = app.book_names
+        self.verse_book_ids = app.verse_book_ids
+        self.verse_chapter_nums = app.verse_chapter_nums
+        self.verse_nums = app.verse_nums
+
+    def is_cancelled(self) -> bool:
+        """Whether a newer search has been started since this one."""
+        return self.app._search_token != self.token
+
+    def run(self):
+        """Search in background, giving up as soon as a newer search starts."""
+        normalized_term = self.normalized_term
+
+        try:
+            verse_ids = self.find_verses()
+            # LIKE treats these as wildcards, so such matches still need confirming
+            check_text = '%' in normalized_term or '_' in normalized_term
+        except sqlite3.Error:
+            if self.is_cancelled():
+                return
+            # Without the search database every verse has to be checked
+            verse_ids = range(len(self.verses_flat))
+            check_text = True
+
+        results = []
+        for n, verse_id in enumerate(verse_ids):
+            if n % 1000 == 0 and self.is_cancelled():
+                return
+
+            text = self.verses_flat[verse_id]
+            if check_text and normalized_term not in text.casefold():
+                continue
+
+            # Interned so the few hundred distinct chapter and verse labels are shared across hits
+            results.append(Hit(book=self.book_names[self.verse_book_ids[verse_id]],
+                               chapter=sys.intern(str(self.verse_chapter_nums[verse_id])),
+                               verse=sys.intern(str(self.verse_nums[verse_id])),
+                               text=text))
+
+        self.signals.finished.emit(self.token, results)
+
+    def find_verses(self) -> List[int]:
+        """Returns the ids of the verses containing the term, in canonical order."""
+        connection = sqlite3.connect(f"{SEARCH_DB_FILEPATH.as_uri()}?mode=ro", uri=True)
+        try:
+            # Abandons the query with an OperationalError once a newer search starts
+            connection.set_progress_handler(self.is_cancelled, 10000)
+            # The trigram index serves LIKE directly, as long as no ESCAPE clause is given
+            rows = connection.execute("SELECT rowid FROM verses WHERE text LIKE ? ORDER BY rowid",
+                                      (f"%{self.normalized_term}%",))
+            return [verse_id for verse_id, in rows]
+        finally:
+            connection.close()
+
 
 class BibleReaderApp(QMainWindow):
     """Modern Bible Reader with PySide6."""
@@ -102,6 +466,9 @@ class BibleReaderApp(QMainWindow):
         "Keep digging! There are treasures waiting for you in every chapter. 👑"
     ]
 
+    # Stylesheet read from the Qt resource once and shared by every window
+    _stylesheet = None
+
     def __init__(self):
         super().__init__()
 
@@ -122,17 +489,64 @@ class BibleReaderApp(QMainWindow):
             "James", "1 Peter", "2 Peter", "1 John", "2 John",
             "3 John", "Jude", "Revelation"
         ]
+        self.canonical_book_set = frozenset(self.canonical_books)
 
         self.bible_data: Dict[str, Any] = {}
-        self.search_results: List[Dict[str, str]] = []
+        self.book_names: Tuple[str, ...] = ()
+        self._book_set: frozenset = frozenset()
+        self.search_results: List[Hit] = []
         self.current_result_index = 0
-
-        self.init_ui()
+        self.results_batch_size = 50
+        self._rendered_count = 0
+        self._results_pattern = None
+        self._results_document = None
+        self._results_revision = -1
+        self._last_term = None
+        self._term_re = None
+
+        # Recently rendered chapters, most recent last, and the copy on display
+        self.document_cache_size = 32
+        self._document_cache: OrderedDict = OrderedDict()
+        self._document_copy = None
+
+        # The displayed chapter with a highlighted verse, so the highlight can be moved in place
+        self._highlight_chapter = None
+        self._highlight_verse = None
+        self._highlight_document = None
+        self._highlight_revision = -1
+
+        # Orderings, filled in by _build_orderings once the data is loaded
+        self.book_index: Dict[str, int] = {}
+        self.sorted_chapters: Dict[str, List[str]] = {}
+        # Verse numbers and texts of each chapter, in verse order
+        self.chapters: Dict[Tuple[str, str], Tuple[List[str], List[str]]] = {}
+
+        # Search index, filled in by IndexBuilder once the data is loaded
+        self.verses_flat: List[str] = []
+        self.verse_book_ids = array('H')
+        self.verse_chapter_nums = array('H')
+        self.verse_nums = array('H')
+
+        # Bumped on every search so stale background searches can be dropped
+        self._search_token = 0
+        self._search_pending = False
+        self._active_search_term = ""
+        # The term the displayed results were found for, set once they arrive
+        self._results_term = ""
+        self.index_builder = None
+
+        self.init_ui_critical()
+        # Build the rest once the window has painted; runs on the asyncio loop
+        QTimer.singleShot(0, self._finish_init)
+
+    def _finish_init(self):
+        """Build the deferred UI, apply styles and start loading data."""
+        self.init_ui_deferred()
         self.apply_styles()
         self.load_data_async()
 
-    def init_ui(self):
-        """Initialize the user interface."""
+    def init_ui_critical(self):
+        """Initialize the window, header and status bar."""
         self.setWindowTitle("📖 KJV Bible Reader")
         self.setGeometry(100, 100, 1200, 800)
         self.setMinimumSize(900, 600)
@@ -140,24 +554,39 @@ class BibleReaderApp(QMainWindow):
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setSpacing(0)
-        main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout = QVBoxLayout(central_widget)
+        self.main_layout.setSpacing(0)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
 
         # Header
-        self.create_header(main_layout)
-
-        # Control panel
-        self.create_control_panel(main_layout)
-
-        # Content area
-        self.create_content_area(main_layout)
+        self.create_header(self.main_layout)
 
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Loading Bible data...")
 
+    def init_ui_deferred(self):
+        """Initialize the control panel, content area and shortcuts."""
+        # Control panel
+        self.create_control_panel(self.main_layout)
+
+        # Content area
+        self.create_content_area(self.main_layout)
+
+        # Search as you type, once typing pauses
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self.search_as_you_type)
+        self.search_input.textChanged.connect(lambda _: self._search_debounce.start())
+
+        # Appends the remaining search results a batch at a time
+        self._results_batch_timer = QTimer(self)
+        self._results_batch_timer.setSingleShot(True)
+        self._results_batch_timer.setInterval(0)
+        self._results_batch_timer.timeout.connect(self.render_next_result_batch)
+
         # Keyboard shortcuts
         self.setup_shortcuts()
 
@@ -311,6 +740,7 @@ class BibleReaderApp(QMainWindow):
         self.text_display = QTextEdit()
         self.text_display.setObjectName("textDisplay")
         self.text_display.setReadOnly(True)
+        self.text_display.setUndoRedoEnabled(False)
         display_font = QFont("Georgia", 13)
         self.text_display.setFont(display_font)
         self.text_display.setPlainText("Loading Bible data, please wait...")
@@ -328,280 +758,128 @@ class BibleReaderApp(QMainWindow):
 
     def apply_styles(self):
         """Apply custom stylesheet."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f7fa;
-            }
-
-            #header {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1e3a8a, stop:1 #3b82f6);
-                border-bottom: 3px solid #1e40af;
-            }
-
-            #title {
-                color: white;
-                padding: 10px;
-            }
-
-            QGroupBox {
-                font-size: 13px;
-                font-weight: bold;
-                border: 2px solid #e5e7eb;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                background-color: white;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-                color: #1e40af;
-            }
-
-            #controlGroup {
-                margin: 20px;
-            }
-
-            QLabel {
-                color: #374151;
-                font-size: 12px;
-                font-weight: 600;
-            }
-
-            #contentTitle {
-                color: #1e40af;
-                font-size: 18px;
-                font-weight: bold;
-            }
-
-            QComboBox {
-                border: 2px solid #d1d5db;
-                border-radius: 6px;
-                padding: 8px 12px;
-                background-color: white;
-                font-size: 12px;
-                min-height: 20px;
-            }
-
-            QComboBox:hover {
-                border: 2px solid #3b82f6;
-            }
-
-            QComboBox:focus {
-                border: 2px solid #1e40af;
-            }
-
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #6b7280;
-                margin-right: 5px;
-            }
-
-            QLineEdit {
-                border: 2px solid #d1d5db;
-                border-radius: 6px;
-                padding: 10px 15px;
-                background-color: white;
-                font-size: 13px;
-                min-height: 20px;
-            }
-
-            QLineEdit:hover {
-                border: 2px solid #3b82f6;
-            }
-
-            QLineEdit:focus {
-                border: 2px solid #1e40af;
-                background-color: #f0f9ff;
-            }
-
-            QPushButton {
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 12px;
-                font-weight: bold;
-                min-height: 20px;
-            }
-
-            #primaryButton {
-                background-color: #1e40af;
-                color: white;
-            }
-
-            #primaryButton:hover {
-                background-color: #1e3a8a;
-            }
-
-            #primaryButton:pressed {
-                background-color: #1e3a8a;
-            }
-
-            #searchButton {
-                background-color: #f59e0b;
-                color: white;
-            }
-
-            #searchButton:hover {
-                background-color: #d97706;
-            }
-
-            #searchButton:pressed {
-                background-color: #b45309;
-            }
-
-            #navButton {
-                background-color: #6b7280;
-                color: white;
-            }
-
-            #navButton:hover {
-                background-color: #4b5563;
-            }
-
-            #navButton:pressed {
-                background-color: #374151;
-            }
-
-            #clearButton {
-                background-color: #e5e7eb;
-                color: #374151;
-            }
-
-            #clearButton:hover {
-                background-color: #d1d5db;
-            }
-
-            #clearButton:pressed {
-                background-color: #9ca3af;
-            }
-
-            QPushButton:disabled {
-                background-color: #e5e7eb;
-                color: #9ca3af;
-            }
-
-            #textDisplay {
-                border: 2px solid #e5e7eb;
-                border-radius: 8px;
-                background-color: #fafafa;
-                padding: 20px;
-                line-height: 1.8;
-            }
-
-            QTextEdit {
-                selection-background-color: #bfdbfe;
-            }
-
-            QStatusBar {
-                background-color: #f3f4f6;
-                color: #6b7280;
-                border-top: 1px solid #d1d5db;
-                font-size: 11px;
-                padding: 5px;
-            }
-
-            QScrollBar:vertical {
-                border: none;
-                background: #f3f4f6;
-                width: 12px;
-                border-radius: 6px;
-            }
-
-            QScrollBar::handle:vertical {
-                background: #cbd5e1;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background: #94a3b8;
-            }
-
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        if BibleReaderApp._stylesheet is None:
+            # Compiled into resources_rc.py from styles.qss
+            qss_file = QFile(":/styles.qss")
+            qss_file.open(QFile.ReadOnly)
+            BibleReaderApp._stylesheet = bytes(qss_file.readAll()).decode("utf-8")
+            qss_file.close()
+
+        self.setStyleSheet(BibleReaderApp._stylesheet)
 
     def load_data_async(self):
-        """Load Bible data in background thread."""
+        """Load Bible data as an asyncio task."""
         self.loader = DataLoader()
         self.loader.data_loaded.connect(self.on_data_loaded)
+        self.loader.book_parsed.connect(self.on_book_parsed)
         self.loader.status_update.connect(self.status_bar.showMessage)
-        self.loader.start()
+        self.load_task = asyncio.ensure_future(self.loader.load())
+
+    def on_book_parsed(self, book: str, chapters: Dict[str, Any]):
+        """Make a book available for reading as soon as it has been parsed."""
+        if book not in self.canonical_book_set or not isinstance(chapters, dict):
+            return
+
+        self.bible_data[book] = chapters
+        self._set_book_names()
+        self._add_book_orderings(book, chapters)
+
+        self.book_combo.blockSignals(True)
+        self.book_combo.insertItem(self.book_index[book], book)
+        self.book_combo.blockSignals(False)
 
     def on_data_loaded(self, data: Dict[str, Any]):
         """Handle loaded Bible data."""
         self.bible_data = data
 
         if self.bible_data:
-            # Get books in canonical order
-            self.book_names = [book for book in self.canonical_books if book in self.bible_data]
-            self.book_combo.addItems(self.book_names)
+            self._set_book_names()
+            # Adopt the cache rather than keeping a second reference to it alive in the loader
+            cache, self.loader.cache = self.loader.cache, {}
+            if cache:
+                self.sorted_chapters = cache['sorted_chapters']
+                self.chapters = cache['chapters']
+            else:
+                self._build_orderings()
+
+            # Books streamed in while parsing are already listed
+            listed_books = tuple(self.book_combo.itemText(i) for i in range(self.book_combo.count()))
+            if listed_books != self.book_names:
+                self.book_combo.blockSignals(True)
+                self.book_combo.clear()
+                self.book_combo.addItems(self.book_names)
+                self.book_combo.blockSignals(False)
 
             if self.book_names:
+                self.book_combo.blockSignals(True)
                 self.book_combo.setCurrentText(self.book_names[0])
+                self.book_combo.blockSignals(False)
                 self.update_chapters()
                 self.display_welcome()
                 self.status_bar.showMessage("Ready - Select a book and chapter to read")
+                if cache:
+                    self.on_index_built(cache['index'])
+                else:
+                    self.build_index_async()
         else:
+            self.book_combo.clear()
             self.content_title.setText("Error")
             self.text_display.setPlainText("Failed to load Bible data. Please check your internet connection.")
             self.status_bar.showMessage("Failed to load Bible data")
             QMessageBox.critical(self, "Error", "Could not load Bible data.\nPlease check your internet connection.")
 
+    def _set_book_names(self):
+        """Lists the loaded books in canonical order, with their positions and membership set."""
+        self.book_names = tuple(book for book in self.canonical_books if book in self.bible_data)
+        self.book_index = {book: i for i, book in enumerate(self.book_names)}
+        self._book_set = frozenset(self.book_names)
+
+    def _build_orderings(self):
+        """Sort chapter and verse numbers once so navigation and search can reuse them."""
+        self.sorted_chapters = {}
+        self.chapters = {}
+
+        for book, book_data in self.bible_data.items():
+            self._add_book_orderings(book, book_data)
+
+    def _add_book_orderings(self, book: str, book_data: Dict[str, Any]):
+        """Sort the chapters of a single book and lay out each chapter's verses in order."""
+        self.sorted_chapters[book] = sorted(book_data, key=int)
+        for chapter, chapter_data in book_data.items():
+            verse_numbers = sorted(chapter_data, key=int)
+            self.chapters[(book, chapter)] = (verse_numbers, [chapter_data[verse_num] for verse_num in verse_numbers])
+
+    def build_index_async(self):
+        """Build the search index in background thread."""
+        self.index_builder = IndexBuilder(self.bible_data, self.book_names,
+                                          self.sorted_chapters, self.chapters)
+        self.index_builder.index_built.connect(self.on_index_built)
+        self.index_builder.start()
+
+    def on_index_built(self, index: Dict[str, Any]):
+        """Handle the built search index."""
+        self.verses_flat = index['verses_flat']
+        self.verse_book_ids = index['verse_book_ids']
+        self.verse_chapter_nums = index['verse_chapter_nums']
+        self.verse_nums = index['verse_nums']
+
+        if self._search_pending:
+            self._search_pending = False
+            # While the term is still being edited, search_as_you_type decides whether to search
+            if self.search_input.text().strip() and not self._search_debounce.isActive():
+                self.search_bible()
+
+    def closeEvent(self, event):
+        """Let a running index build finish before the window goes away."""
+        # Destroying a QThread that is still running aborts the process
+        if self.index_builder is not None:
+            self.index_builder.wait()
+        super().closeEvent(event)
+
     def display_welcome(self):
         """Display welcome message with a random encouraging quote."""
         self.content_title.setText("Welcome to KJV Bible Reader")
-
-        # Select a random encouraging message
-        encouraging_message = random.choice(self.WELCOME_MESSAGES)
-
-        # The standard instruction text, using HTML for better formatting
-        instruction_text = """
-<div style="font-family: Georgia; font-size: 14px; line-height: 2.0; color: #1f2937; margin-top: 20px;">
-    <h3 style="color: #1e40af; border-bottom: 1px solid #d1d5db; padding-bottom: 5px;">📖 Getting Started</h3>
-    <ul style="list-style-type: none; padding-left: 0;">
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Select a Book and Chapter from the dropdowns above.</li>
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Click 'Read Chapter' or the chapter will load automatically.</li>
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Use <b>◄ Previous</b> and <b>Next ►</b> buttons to navigate between chapters.</li>
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Use the <b>Search</b> box to find verses containing specific words.</li>
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> Press <b>Ctrl+F</b> to quickly jump to search.</li>
-    </ul>
-
-    <h3 style="color: #1e40af; border-bottom: 1px solid #d1d5db; padding-bottom: 5px;">⌨️ Keyboard Shortcuts</h3>
-    <ul style="list-style-type: none; padding-left: 0;">
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> <b>Left Arrow:</b> Previous Chapter</li>
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> <b>Right Arrow:</b> Next Chapter</li>
-        <li><span style="color: #3b82f6; margin-right: 8px;">•</span> <b>Enter (in search):</b> Search Bible</li>
-    </ul>
-</div>
-        """
-
-        # Combine the encouragement and instructions in a nicely formatted HTML block
-        html_content = f"""
-<div style="font-family: 'Segoe UI', sans-serif; padding: 15px; background-color: #e0f2fe; border-radius: 8px; border: 1px solid #90cdf4; margin-bottom: 25px;">
-    <p style="font-size: 16px; color: #1e40af; font-weight: bold; margin: 0;">
-        {encouraging_message}
-    </p>
-</div>
-{instruction_text}
-<div style="font-family: Georgia; font-size: 14px; line-height: 1.5; color: #6b7280; margin-top: 25px; padding-top: 10px; border-top: 1px dashed #d1d5db;">
-    The King James Version of the Bible is loaded and ready to read.
-</div>
-        """
-
-        self.text_display.setHtml(html_content)
+        self.text_display.setHtml(WELCOME_HTML_TEMPLATE.format(msg=random.choice(self.WELCOME_MESSAGES)))
 
 
     def on_book_changed(self):
@@ -610,18 +888,25 @@ class BibleReaderApp(QMainWindow):
         if self.bible_data:
             self.read_chapter()
 
-    def update_chapters(self):
-        """Update chapter dropdown based on selected book."""
+    def update_chapters(self, chapter_index: int = 0):
+        """Update chapter dropdown based on selected book, without displaying a chapter.
+
+        chapter_index selects the initial chapter; negative values count from the end.
+        """
         book = self.book_combo.currentText()
+
+        # Repopulating would otherwise re-render on every intermediate selection
+        was_blocked = self.chapter_combo.blockSignals(True)
         self.chapter_combo.clear()
 
-        if book and book in self.bible_data:
-            chapters = sorted([int(c) for c in self.bible_data[book].keys()])
-            chapter_strs = [str(c) for c in chapters]
+        if book in self._book_set:
+            chapter_strs = self.sorted_chapters[book]
             self.chapter_combo.addItems(chapter_strs)
 
             if chapter_strs:
-                self.chapter_combo.setCurrentText(chapter_strs[0])
+                self.chapter_combo.setCurrentIndex(chapter_index % len(chapter_strs))
+
+        self.chapter_combo.blockSignals(was_blocked)
 
     def on_chapter_changed(self):
         """Handle chapter selection change."""
@@ -637,37 +922,16 @@ class BibleReaderApp(QMainWindow):
             return
 
         try:
-            chapter_data = self.bible_data[book][chapter]
-            # FIX: Get and sort verse numbers numerically
-            verse_numbers = sorted([int(v) for v in chapter_data.keys()])
-
-            # Build HTML content
-            html = f"""
-            <div style="font-family: Georgia; font-size: 14px; line-height: 2.0; color: #1f2937;">
-                <h2 style="color: #1e40af; border-bottom: 2px solid #3b82f6; padding-bottom: 10px;">
-                    {book} - Chapter {chapter}
-                </h2>
-                <div style="margin-top: 20px;">
-            """
-
-            for verse_num_int in verse_numbers:
-                verse_num = str(verse_num_int)
-                text = chapter_data[verse_num]
-
-                html += f"""
-                <p style="margin: 15px 0;">
-                    <span style="color: #3b82f6; font-weight: bold; font-size: 11px; margin-right: 8px;">
-                        {verse_num}
-                    </span>
-                    <span>{text}</span>
-                </p>
-                """
-
-            html += "</div></div>"
-
-            self.text_display.setHtml(html)
+            # FIX: Verses are laid out in numerical order once at load
+            verse_numbers, verse_texts = self.chapters[(book, chapter)]
+
+            cache_key = (book, chapter, "", None)
+            if not self.show_cached_document(cache_key):
+                self.text_display.setHtml(self.chapter_html(f"{book} - Chapter {chapter}", verse_numbers, verse_texts))
+                self.cache_document(cache_key)
+
             self.content_title.setText(f"{book} - Chapter {chapter}")
-            self.status_bar.showMessage(f"{book} {chapter} (KJV) — {len(chapter_data)} verses")
+            self.status_bar.showMessage(f"{book} {chapter} (KJV) — {len(verse_numbers)} verses")
             self.search_nav_widget.hide()
 
         except KeyError:
@@ -683,20 +947,20 @@ class BibleReaderApp(QMainWindow):
         if not book or not chapter:
             return
 
-        chapters = [self.chapter_combo.itemText(i) for i in range(self.chapter_combo.count())]
-        current_idx = chapters.index(chapter)
+        current_idx = self.chapter_combo.currentIndex()
 
         if current_idx > 0:
-            self.chapter_combo.setCurrentText(chapters[current_idx - 1])
+            self.chapter_combo.setCurrentIndex(current_idx - 1)
         else:
             # Go to previous book
-            book_idx = self.book_names.index(book)
+            book_idx = self.book_index[book]
             if book_idx > 0:
-                self.book_combo.setCurrentText(self.book_names[book_idx - 1])
-                self.update_chapters()
+                self.book_combo.blockSignals(True)
+                self.book_combo.setCurrentIndex(book_idx - 1)
+                self.book_combo.blockSignals(False)
                 # Set to last chapter
-                last_chapter = self.chapter_combo.itemText(self.chapter_combo.count() - 1)
-                self.chapter_combo.setCurrentText(last_chapter)
+                self.update_chapters(-1)
+                self.read_chapter()
 
     def next_chapter(self):
         """Navigate to next chapter."""
@@ -706,22 +970,24 @@ class BibleReaderApp(QMainWindow):
         if not book or not chapter:
             return
 
-        chapters = [self.chapter_combo.itemText(i) for i in range(self.chapter_combo.count())]
-        current_idx = chapters.index(chapter)
+        current_idx = self.chapter_combo.currentIndex()
 
-        if current_idx < len(chapters) - 1:
-            self.chapter_combo.setCurrentText(chapters[current_idx + 1])
+        if current_idx < self.chapter_combo.count() - 1:
+            self.chapter_combo.setCurrentIndex(current_idx + 1)
         else:
             # Go to next book
-            book_idx = self.book_names.index(book)
+            book_idx = self.book_index[book]
             if book_idx < len(self.book_names) - 1:
-                self.book_combo.setCurrentText(self.book_names[book_idx + 1])
-                self.update_chapters()
+                self.book_combo.blockSignals(True)
+                self.book_combo.setCurrentIndex(book_idx + 1)
+                self.book_combo.blockSignals(False)
                 # Set to first chapter
-                self.chapter_combo.setCurrentText(self.chapter_combo.itemText(0))
+                self.update_chapters()
+                self.read_chapter()
 
     def search_bible(self):
         """Search the entire Bible."""
+        self._search_debounce.stop()
         search_term = self.search_input.text().strip()
 
         if not search_term:
@@ -731,38 +997,40 @@ class BibleReaderApp(QMainWindow):
         if not self.bible_data:
             return
 
+        self._search_token += 1
+
+        if not self.verses_flat:
+            # Run the search as soon as the index is ready
+            self._search_pending = True
+            self.status_bar.showMessage("Preparing search index...")
+            return
+
         self.status_bar.showMessage("Searching Bible...")
         self.content_title.setText(f"Searching for: '{search_term}'...")
         self.text_display.setPlainText("Processing search, please wait...")
 
-        QApplication.processEvents()
-
-        normalized_term = search_term.lower()
-        self.search_results = []
-
-        # Search through all verses
-        for book_name in self.book_names:
-            book_data = self.bible_data[book_name]
-            # Ensure chapters are processed in order for better search result grouping
-            chapter_numbers = sorted([int(c) for c in book_data.keys()])
-            for chapter_num_int in chapter_numbers:
-                chapter_num = str(chapter_num_int)
-                chapter_data = book_data[chapter_num]
-                # Ensure verses are processed in order
-                verse_numbers = sorted([int(v) for v in chapter_data.keys()])
-                for verse_num_int in verse_numbers:
-                    verse_num = str(verse_num_int)
-                    verse_text = chapter_data[verse_num]
-                    if normalized_term in verse_text.lower():
-                        reference = f"{book_name} {chapter_num}:{verse_num}"
-                        self.search_results.append({
-                            'reference': reference,
-                            'book': book_name,
-                            'chapter': chapter_num,
-                            'verse': verse_num,
-                            'text': verse_text
-                        })
+        self._active_search_term = search_term
+        worker = SearchWorker(self, search_term.casefold(), self._search_token)
+        worker.signals.finished.connect(self.on_search_done)
+        QThreadPool.globalInstance().start(worker)
+
+    def search_as_you_type(self):
+        """Search for the typed term once it is long enough to narrow things down."""
+        # Shorter terms match most of the Bible; Enter still searches for them
+        if len(self.search_input.text().strip()) >= 3:
+            self.search_bible()
+        elif self._search_pending:
+            self._search_pending = False
+            self.status_bar.clearMessage()
+
+    def on_search_done(self, token: int, results: List[Hit]):
+        """Handle the results of a background search."""
+        if token != self._search_token:
+            return
 
+        search_term = self._active_search_term
+        self._results_term = search_term
+        self.search_results = results
         self.current_result_index = 0
 
         if self.search_results:
@@ -776,53 +1044,121 @@ class BibleReaderApp(QMainWindow):
             self.search_nav_widget.hide()
 
     def display_search_results(self):
-        """Display search results with highlighting."""
+        """Display the first batch of search results, appending the rest in the background."""
         if not self.search_results:
             return
 
-        search_term = self.search_input.text().strip().lower()
+        title = f"Search Results: '{self._results_term}' ({len(self.search_results)} found)"
+        self._results_pattern = self.highlight_pattern()
+        first_batch = self.search_results[:self.results_batch_size]
+        self.text_display.setHtml(HEADING_HTML_TEMPLATE.format(title=html.escape(title))
+                                  + self.results_html(first_batch, 1))
 
-        html = f"""
-        <div style="font-family: Georgia; font-size: 13px; line-height: 1.9; color: #1f2937;">
-            <h2 style="color: #1e40af; border-bottom: 2px solid #3b82f6; padding-bottom: 10px;">
-                Search Results: '{self.search_input.text()}' ({len(self.search_results)} found)
-            </h2>
-            <div style="margin-top: 20px;">
-        """
+        self._rendered_count = len(first_batch)
+        self._results_document = self.text_display.document()
+        self._results_revision = self._results_document.revision()
+        if self._rendered_count < len(self.search_results):
+            self._results_batch_timer.start()
 
-        for i, result in enumerate(self.search_results, 1):
-            # Highlight search term
-            text = result['text']
-            text_lower = text.lower()
-            highlighted_text = ""
-            last_pos = 0
-
-            pos = text_lower.find(search_term)
-            while pos != -1:
-                highlighted_text += text[last_pos:pos]
-                highlighted_text += f'<span style="background-color: #fef3c7; padding: 2px 4px; border-radius: 3px; font-weight: 600;">{text[pos:pos+len(search_term)]}</span>'
-                last_pos = pos + len(search_term)
-                pos = text_lower.find(search_term, last_pos)
-
-            highlighted_text += text[last_pos:]
-
-            html += f"""
-            <div style="margin-bottom: 25px; padding: 15px; background-color: white; border-left: 4px solid #3b82f6; border-radius: 6px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                <div style="color: #059669; font-weight: bold; font-size: 13px; margin-bottom: 8px;">
-                    {i}. {result['reference']}
-                </div>
-                <div style="color: #374151; font-size: 14px;">
-                    {highlighted_text}
-                </div>
-            </div>
-            """
-
-        html += "</div></div>"
-
-        self.text_display.setHtml(html)
-        self.content_title.setText(f"Search Results: '{self.search_input.text()}' ({len(self.search_results)} found)")
+        self.content_title.setText(title)
         self.update_result_navigation()
 
+    def render_next_result_batch(self):
+        """Append the next batch of search results, unless something else has been displayed since."""
+        document = self.text_display.document()
+        if document is not self._results_document or document.revision() != self._results_revision:
+            return
+
+        start = self._rendered_count
+        batch = self.search_results[start:start + self.results_batch_size]
+
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        # insertHtml merges its first paragraph into the current block, so open a block
+        # formatted like the first result's reference (block 1, after the heading)
+        cursor.insertBlock(document.findBlockByNumber(1).blockFormat())
+        # One insertHtml per batch rather than a Qt call per run of text
+        cursor.insertHtml(self.results_html(batch, start + 1))
+
+        self._rendered_count += len(batch)
+        self._results_revision = document.revision()
+        if self._rendered_count < len(self.search_results):
+            self._results_batch_timer.start()
+
+    def results_html(self, results: List[Hit], first_number: int) -> str:
+        """Builds the markup for a run of search results, numbered from first_number."""
+        return "".join(RESULT_HTML_TEMPLATE.format(number=i, reference=html.escape(result.reference),
+                                                   text=self.verse_html(result.text, self._results_pattern))
+                       for i, result in enumerate(results, first_number))
+
+    def chapter_html(self, title: str, verse_numbers: List[str], verse_texts: List[str],
+                     current_verse: str = "", pattern: Optional[re.Pattern] = None) -> str:
+        """Builds the markup for a chapter, marking the current verse and highlighting matches of the pattern."""
+        # One setHtml per chapter rather than a Qt call per run of text
+        parts = [HEADING_HTML_TEMPLATE.format(title=html.escape(title))]
+        for verse_num, text in zip(verse_numbers, verse_texts):
+            style = CURRENT_VERSE_STYLE if verse_num == current_verse else VERSE_STYLE
+            parts.append(VERSE_HTML_TEMPLATE.format(style=style, number=verse_num, text=self.verse_html(text, pattern)))
+        return "".join(parts)
+
+    def verse_html(self, text: str, pattern: Optional[re.Pattern] = None) -> str:
+        """Escapes verse text, wrapping every match of the pattern in the highlight markup."""
+        if pattern is None:
+            return html.escape(text)
+
+        # Matched against the casefolded text, as searches are, then mapped back onto the verse
+        folded = text.casefold()
+        offsets = None
+        if len(folded) != len(text):
+            # Some characters fold to several (ß to ss); note where each folded one came from
+            offsets = [i for i, char in enumerate(text) for _ in char.casefold()]
+
+        parts = []
+        last = 0
+        for match in pattern.finditer(folded):
+            start, end = match.span()
+            if offsets is not None:
+                # A match ending inside a folded character highlights all of it
+                start, end = max(offsets[start], last), offsets[end - 1] + 1
+                if start >= end:
+                    continue
+            parts.append(html.escape(text[last:start]))
+            parts.append(HIGHLIGHT_HTML_TEMPLATE.format(text=html.escape(text[start:end])))
+            last = end
+        parts.append(html.escape(text[last:]))
+        return "".join(parts)
+
+    def show_cached_document(self, key: Tuple) -> bool:
+        """Displays a copy of a cached rendering, returning whether there was one."""
+        cached = self._document_cache.get(key)
+        if cached is None:
+            return False
+        self._document_cache.move_to_end(key)
+
+        # A copy, so later edits of the display never reach the cache
+        document = cached.clone(self.text_display)
+        document.setUndoRedoEnabled(False)
+        previous, self._document_copy = self._document_copy, document
+        self.text_display.setDocument(document)
+        if previous is not None:
+            previous.deleteLater()
+        return True
+
+    def cache_document(self, key: Tuple):
+        """Keeps a copy of the displayed document, dropping the least recently used."""
+        self._document_cache[key] = self.text_display.document().clone(self)
+        if len(self._document_cache) > self.document_cache_size:
+            self._document_cache.popitem(last=False)[1].deleteLater()
+
+    def highlight_pattern(self) -> re.Pattern:
+        """Returns a pattern for the casefolded term of the displayed results, compiled once per term."""
+        # Not the box, which may have been edited or searched again since
+        search_term = self._results_term.casefold()
+        if search_term != self._last_term:
+            self._term_re = re.compile(re.escape(search_term))
+            self._last_term = search_term
+        return self._term_re
+
     def update_result_navigation(self):
         """Update search result navigation."""
         if self.search_results:
@@ -852,92 +1188,92 @@ class BibleReaderApp(QMainWindow):
         # Update navigation
         self.update_result_navigation()
 
-        # Navigate to the book and chapter
+        # Navigate to the book and chapter, leaving the combos alone when they already match
         self.book_combo.blockSignals(True)
         self.chapter_combo.blockSignals(True)
 
-        self.book_combo.setCurrentText(result['book'])
-        self.update_chapters()
-        self.chapter_combo.setCurrentText(result['chapter'])
+        if self.book_combo.currentText() != result.book:
+            self.book_combo.setCurrentText(result.book)
+            self.update_chapters()
+        if self.chapter_combo.currentText() != result.chapter:
+            self.chapter_combo.setCurrentText(result.chapter)
 
         self.book_combo.blockSignals(False)
         self.chapter_combo.blockSignals(False)
 
         # Display the chapter with highlighting
-        self.display_chapter_with_highlight(result['book'], result['chapter'], result['verse'])
+        self.display_chapter_with_highlight(result.book, result.chapter, result.verse)
 
     def display_chapter_with_highlight(self, book: str, chapter: str, highlight_verse: str):
         """Display a chapter with a specific verse highlighted. FIX: Verses are read in numerical order."""
         try:
-            chapter_data = self.bible_data[book][chapter]
-            search_term = self.search_input.text().strip().lower()
-            # FIX: Get and sort verse numbers numerically
-            verse_numbers = sorted([int(v) for v in chapter_data.keys()])
-
-            html = f"""
-            <div style="font-family: Georgia; font-size: 14px; line-height: 2.0; color: #1f2937;">
-                <h2 style="color: #1e40af; border-bottom: 2px solid #3b82f6; padding-bottom: 10px;">
-                    {book} - Chapter {chapter}
-                </h2>
-                <div style="margin-top: 20px;">
-            """
-
-            for verse_num_int in verse_numbers:
-                verse_num = str(verse_num_int)
-                text = chapter_data[verse_num]
-
-                # Highlight the matching verse
-                is_highlight = (verse_num == highlight_verse)
-
-                # Add highlighting for search term
-                display_text = text
-                if search_term and search_term in text.lower():
-                    text_lower = text.lower()
-                    highlighted_text = ""
-                    last_pos = 0
-
-                    pos = text_lower.find(search_term)
-                    while pos != -1:
-                        highlighted_text += text[last_pos:pos]
-                        highlighted_text += f'<span style="background-color: #fef3c7; padding: 2px 4px; border-radius: 3px; font-weight: 600;">{text[pos:pos+len(search_term)]}</span>'
-                        last_pos = pos + len(search_term)
-                        pos = text_lower.find(search_term, last_pos)
-
-                    highlighted_text += text[last_pos:]
-                    display_text = highlighted_text
-
-                # Style for highlighted verse
-                verse_style = ""
-                if is_highlight:
-                    verse_style = 'background-color: #dbeafe; padding: 10px; border-radius: 6px; border-left: 4px solid #3b82f6;'
-
-                html += f"""
-                <p style="margin: 15px 0; {verse_style}">
-                    <span style="color: #3b82f6; font-weight: bold; font-size: 11px; margin-right: 8px;">
-                        {verse_num}
-                    </span>
-                    <span>{display_text}</span>
-                </p>
-                """
-
-            html += "</div></div>"
-
-            self.text_display.setHtml(html)
+            pattern = self.highlight_pattern() if self._results_term else None
+            # FIX: Verses are laid out in numerical order once at load
+            verse_numbers, verse_texts = self.chapters[(book, chapter)]
+
+            chapter_key = (book, chapter, self._results_term.casefold())
+            if (not self.move_verse_highlight(chapter_key, verse_numbers, highlight_verse)
+                    and not self.show_cached_document(chapter_key + (highlight_verse,))):
+                self.text_display.setHtml(self.chapter_html(f"{book} - Chapter {chapter}", verse_numbers, verse_texts,
+                                                            highlight_verse, pattern))
+                self.cache_document(chapter_key + (highlight_verse,))
+            self.scroll_to_verse(verse_numbers, highlight_verse)
+
+            document = self.text_display.document()
+            self._highlight_chapter = chapter_key
+            self._highlight_verse = highlight_verse
+            self._highlight_document = document
+            self._highlight_revision = document.revision()
+
             self.content_title.setText(f"{book} - Chapter {chapter}")
             self.status_bar.showMessage(f"Result {self.current_result_index + 1}/{len(self.search_results)}: {book} {chapter}:{highlight_verse}")
 
-            # Scroll to highlighted verse
-            cursor = self.text_display.textCursor()
-            cursor.movePosition(cursor.Start)
-            self.text_display.setTextCursor(cursor)
-
         except KeyError:
             self.content_title.setText("Error")
             self.text_display.setPlainText(f"Chapter {book} {chapter} not found.")
 
+    def move_verse_highlight(self, chapter_key: Tuple[str, str, str], verse_numbers: List[str],
+                             verse: str) -> bool:
+        """Moves the verse highlight within the displayed chapter, returning whether it was displayed."""
+        document = self.text_display.document()
+        if (chapter_key != self._highlight_chapter or document is not self._highlight_document
+                or document.revision() != self._highlight_revision):
+            return False
+
+        highlighted = self.verse_block(verse_numbers, self._highlight_verse)
+        target = self.verse_block(verse_numbers, verse)
+        # Swap the two paragraphs' formats, so both keep exactly the layout the markup gave them
+        current_fmt, plain_fmt = highlighted.blockFormat(), target.blockFormat()
+        cursor = QTextCursor(highlighted)
+        cursor.beginEditBlock()
+        cursor.setBlockFormat(plain_fmt)
+        cursor.setPosition(target.position())
+        cursor.setBlockFormat(current_fmt)
+        cursor.endEditBlock()
+        return True
+
+    def verse_block(self, verse_numbers: List[str], verse: str) -> QTextBlock:
+        """Returns the block of a verse in the displayed chapter."""
+        # Block 0 is the heading, followed by one block per verse
+        return self.text_display.document().findBlockByNumber(verse_numbers.index(verse) + 1)
+
+    def scroll_to_verse(self, verse_numbers: List[str], verse: str):
+        """Puts the text cursor on a verse of the displayed chapter and scrolls it into view."""
+        cursor = QTextCursor(self.verse_block(verse_numbers, verse))
+        # Bring the end of the verse into view first, so a long verse is not left cut off
+        cursor.movePosition(QTextCursor.EndOfBlock)
+        self.text_display.setTextCursor(cursor)
+        self.text_display.ensureCursorVisible()
+        cursor.movePosition(QTextCursor.StartOfBlock)
+        self.text_display.setTextCursor(cursor)
+        self.text_display.ensureCursorVisible()
+
     def clear_search(self):
         """Clear search results and input."""
+        self._search_token += 1
+        self._search_pending = False
         self.search_input.clear()
+        self._search_debounce.stop()
         self.search_results = []
         self.current_result_index = 0
         self.search_nav_widget.hide()
@@ -953,7 +1289,9 @@ def main():
     window = BibleReaderApp()
     window.show()
 
-    sys.exit(app.exec())
+    # QtAsyncio.run discards the status app.exec() returns. The reader never quits with a
+    # non-zero code, so returning normally exits with 0, as sys.exit(app.exec()) did
+    QtAsyncio.run(keep_running=True, quit_qapp=True)
 
 
 if __name__ == "__main__":
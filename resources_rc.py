@@ -0,0 +1,86 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03M\
+\x00\
+\x00\x0c\x9dx\x9c\xad\x96M\x8f\xd30\x10\x86\xef\xfd\x15\
+\x91z\x01i\x83\x92\xa6\xe9\x87{[@\x5c@b\xb5\
+H\x9c\x9d\xd8i,\xdc8\xd8\xee\xb6\x0b\xe2\xbf3n\
+\xdc\xc4\xf9j\x8aDWZ\xb5\x89g\xe6\xf1\xcc;c\
+?}\xc1\xac\xf8\xce\x0a\x22N\xde\xef\x99\x07\x9f\x04\xa7\
+?\xf6R\x1c\x0b\xe2\xa7\x82\x0b\x89\xbcy\x16g\xeb\x0c\
+\xeff\x7ff\xb3yN1\xa1\xb2\xb7\x16y?9+\
+(\x96{\x89\x09\xa3\x85~s\x0eQ\xf0\xe0\xbd^\xfe\
+\x9f\x17(\x84\xef\x0b\xf8~\xb13\x1f\xa5E\x89\x02o\
+\x1e\xd2\x08o\xf0C\xf5;\xf4\xe6Q\xb2Yd\xab\xb7\
+\xbb*\x80\x90\x10\xcdO\x84\xd6\xe2\x80\xbc\xa8<{J\
+pF\x8c\xd92\xc0Y\xc5\xa4\x99\xe6\xd4\x22Y\xe6S\
+\xce4\xad|\x94\x98\x10V\xec\x91\x17\x06\xe5\xf9b\xf0\
+\xf4\x09\x98\xcbGq\xb66\x99(\xb4\xaf\xd8/\x0ak\
+\x22\xb3\xa6~x\xa2l\x9fk\x04\x1c\x9c\xb8D\xc8[\
+4(4\xa6k\x9a\xb4\x80M\x12\x8e\x0ay\x9b\xab\xb7\
+\x03d\x86\x15\xbe\xd9\xa3\xe5p\xd0\xec\xe3\xf8\xfa\xb8_\
+\x02\xbb\x1d\x97\x1d!w\xdb\xea\x98\xa4\x00,\x05\xf7\x85\
+d\x10\x0a\xd9\x90\xbb\xee\xebR(\xa6\x99\x80\x05\x10\xd5\
+\xe34\xd3\x9d4\x01\x86\x83x\xd5\x80\x9bo\xeb\xeaB\
+b\xe3W\xc1 -u\x8e?\xe3\x84\xf2vQ\xe6\xd1\
+z\x19\xc6\xe1\xae\x97\xf4\xc5`\xd2WA\xd0\xc4\x03I\
+}\xeb\x97\xb9\xc6\xeaz\xdc\xdc(\xa3\xa1{/\x0e\x89\
+h\x140PU\x12\x92\x98\x0cWu\xd5\xa9\xdf\xa5\xce\
+\xce.F\xeb7\xba\xef\x03h#\xb7\x90M\x0a\xaf\x90\
+(\x17/M\xcf\xf5Q\xab\x96\xe9\xd8d\x22=\xaaq\
+\x1b\xa7\x9e\x8d\x0d\x22R\x94>\xcc\x82\xa2cX\x88\xa2\
+\xddM\xbe\xac`\xc3>,2\xf6>\x96\xb2\x1e)\xec\
+\x80\xf7\xd4ub\xf3i\xc4W\xe9\xad\x82\xd2\x12\x17\xaa\
+\xc4\x12j\xdd\xce{\x15kz\xe1\xa5\x8fV\xcd&W\
+\xc9z\xb1\x09Z\x1d\xd8\xf8\xb22\x85\xa9\xf5\x910\xfd\
+\x9f\x84`\xf2qO'\x8f\x8e\x9da%\x5c)\xffE\
+\x09\xb5\xcd\x9dJ\x18\x1b\xfeA\xb6\xcd\xacP\xbe\x1eU\
+\xfex\x84Y<\xae\x8f\xfb2\xb4\x08Z\xfdys\x0c\
+4\xb3w07\xf3R\x82\xbe\xe4k\x9b\xab\xbf\x0fw\
+\x9b\xbd\xa9\xdav\xd2\xce\xf2\x90+sd\x0d\x19\x96\x92\
+*E\xc9}\xa6\x0a\x8e\xcb4\x9f\xe2\xce\xe2-\x0d\x92\
+1n\xd7\xc7\x146\xd9\xae\xd7\xc1j\xc0n\x92:Y\
+\xc6Q\xb0\xad,\x0b\xfc2\x85\xec\xb6]\x1f\xb9v0\
+\xc5\xbbL\xe2x\x15u\x8d&a\xaf\x87\xcc\xe5\xe4\xe0\
+\xb0\xcf)\x5c\xf7\xfc\x9ep2\x99b;+\xbaf\x93\
+\xd0\xdb\x14G\xb8\xd7e\x880\x85\x13~\xcbp\x08\xde\
+q6\xd7\xf4\xac?0Ur\xfc:>\x02\xee\xb9\xc1\
+\x0cI\x13\x9b\xbfN\x7f7\xadm.\x84u\xbf\x86\xef\
+6\xd5\xee\xbe\x01\x903p\x15\xe545\xf7\x11\x7fH\
+w\x19I2{\xefy\xd6X\x1f\xd5#\xbe\x91\xfd,\
+\xca\x96f\xfa\xb9\xb9p\xb5\xe8\x9e\x12\xe1\xf0\x80w\xc7\
+Q\xd8\x9b]\xf5\xa9\xf1\x9c\xc2\xfd\x87\x03\x0c\x029h\
+\x96b>>\x10\x9d;r\x8b\xf0\xc4\x88\xce\xdd\xa97\
+4:\xdb\xc1P\x8e\x0b\xc2i/\xa8\x1b\x22MHL\
+\xc3\xdb\xc3x\xf8\x90\x19\x8f3\x22{#\xb5%\x863\
+\xa7g\x0f\x09\xf3M\xf9k\x0f\x0f\x9e\xfb\x1a\xae\xa3\xed\
+\xd7\xd6\xf5\x95\xc9\x22\xfd\x05\x1c\xfc\xe24\
+"
+
+qt_resource_name = b"\
+\x00\x0a\
+\x02\xcd\x00\xa3\
+\x00s\
+\x00t\x00y\x00l\x00e\x00s\x00.\x00q\x00s\x00s\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1?B\xb2{\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()